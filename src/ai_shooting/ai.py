@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, Optional, Sequence, Tuple
 
 
 class Personality(Enum):
@@ -23,6 +25,34 @@ class Action(Enum):
     SPECIAL = "special"
 
 
+ACTIONS: List[Action] = list(Action)
+IDX: Dict[Action, int] = {action: i for i, action in enumerate(ACTIONS)}
+IDX_NORMAL_SHOT = IDX[Action.NORMAL_SHOT]
+IDX_STRONG_ATTACK = IDX[Action.STRONG_ATTACK]
+IDX_APPROACH = IDX[Action.APPROACH]
+IDX_KEEP_DISTANCE = IDX[Action.KEEP_DISTANCE]
+IDX_EVADE = IDX[Action.EVADE]
+IDX_STEP = IDX[Action.STEP]
+IDX_SPECIAL = IDX[Action.SPECIAL]
+
+# Context thresholds that shift the weights; one bit each in a context mask.
+CTX_THREAT = 1
+CTX_LOW_ENERGY = 2
+CTX_OVERHEAT = 4
+CTX_LOW_HP = 8
+CTX_SPECIAL_READY = 16
+CTX_STEP_COOLDOWN = 32
+
+# Enum attribute access goes through the metaclass; hot paths use these aliases instead.
+A_NORMAL_SHOT = Action.NORMAL_SHOT
+A_STRONG_ATTACK = Action.STRONG_ATTACK
+A_APPROACH = Action.APPROACH
+A_KEEP_DISTANCE = Action.KEEP_DISTANCE
+A_EVADE = Action.EVADE
+A_STEP = Action.STEP
+A_SPECIAL = Action.SPECIAL
+
+
 BASE_WEIGHTS: Dict[Action, float] = {
     Action.NORMAL_SHOT: 25,
     Action.STRONG_ATTACK: 10,
@@ -32,28 +62,64 @@ BASE_WEIGHTS: Dict[Action, float] = {
     Action.STEP: 5,
     Action.SPECIAL: 5,
 }
+BASE_WEIGHT_VECTOR: Tuple[float, ...] = tuple(float(BASE_WEIGHTS[action]) for action in ACTIONS)
+
+# 性格補正: multipliers apply to the combined weight, offsets are added afterwards.
+PERSONALITY_MULTIPLIERS: Dict[Personality, Dict[Action, float]] = {
+    Personality.AGGRESSIVE: {
+        Action.NORMAL_SHOT: 1.3,
+        Action.STRONG_ATTACK: 1.3,
+        Action.EVADE: 0.7,
+        Action.KEEP_DISTANCE: 0.8,
+    },
+    Personality.PRUDENT: {
+        Action.EVADE: 1.3,
+        Action.KEEP_DISTANCE: 1.1,
+        Action.NORMAL_SHOT: 0.8,
+        Action.STRONG_ATTACK: 0.7,
+    },
+    Personality.SKITTISH: {
+        Action.APPROACH: 0.7,
+        Action.NORMAL_SHOT: 0.8,
+    },
+}
 
+PERSONALITY_OFFSETS: Dict[Personality, Dict[Action, float]] = {
+    Personality.AGGRESSIVE: {},
+    Personality.PRUDENT: {},
+    Personality.SKITTISH: {
+        Action.KEEP_DISTANCE: 20,
+        Action.SPECIAL: -15,
+    },
+}
 
-@dataclass
+
+@dataclass(init=False)
 class OrderBias:
-    values: Dict[Action, float] = field(default_factory=dict)
+    # Replaced, never mutated in place, so holders can detect changes by identity.
+    arr: Tuple[float, ...]
+
+    def __init__(self, values: Optional[Mapping[Action, float]] = None) -> None:
+        values = values or {}
+        self.arr = tuple(float(values.get(action, 0.0)) for action in ACTIONS)
 
-    def __post_init__(self) -> None:
-        for action in Action:
-            self.values.setdefault(action, 0.0)
+    @property
+    def values(self) -> Mapping[Action, float]:
+        """Read-only snapshot; use set_bias to change a value."""
+        return MappingProxyType(dict(zip(ACTIONS, self.arr)))
 
     def __getitem__(self, action: Action) -> float:
-        return self.values[action]
+        return self.arr[IDX[action]]
 
     def set_bias(self, action: Action, value: float) -> None:
-        self.values[action] = value
+        i = IDX[action]
+        self.arr = self.arr[:i] + (float(value),) + self.arr[i + 1:]
 
     def scale(self, factor: float) -> None:
-        for key in self.values:
-            self.values[key] *= factor
+        self.arr = tuple(value * factor for value in self.arr)
 
 
-@dataclass
+@dataclass(slots=True)
 class AIContext:
     threat_level: float
     target_score: float
@@ -66,16 +132,65 @@ class AIContext:
     cooldown_ready: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class AIChoice:
     action: Action
     delay: float
 
 
+class _AliasTable:
+    """Vose alias table: O(1) sampling from a fixed set of weights."""
+
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        n = len(weights)
+        total = sum(weights)
+        scaled = [weight * n / total for weight in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = g
+            scaled[g] += scaled[s] - 1.0
+            if scaled[g] < 1.0:
+                small.append(g)
+            else:
+                large.append(g)
+
+    def sample(self, u: float) -> int:
+        """Map a uniform draw in [0, 1) to an index; the fraction acts as the coin flip."""
+        u *= len(self.prob)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+
 def clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
     return max(minimum, min(value, maximum))
 
 
+def context_mask(ctx: AIContext) -> int:
+    """Collapse the context into the CTX_* flags that affect action weights."""
+    mask = 0
+    if ctx.threat_level > 0.7:
+        mask |= CTX_THREAT
+    if ctx.energy < 20:
+        mask |= CTX_LOW_ENERGY
+    if ctx.heat > 70:
+        mask |= CTX_OVERHEAT
+    if ctx.hp_ratio < 0.3:
+        mask |= CTX_LOW_HP
+    if ctx.special >= 100:
+        mask |= CTX_SPECIAL_READY
+    if not ctx.cooldown_ready:
+        mask |= CTX_STEP_COOLDOWN
+    return mask
+
+
 class AIController:
     """Decides which action the partner AI should perform."""
 
@@ -84,104 +199,128 @@ class AIController:
         personality: Personality = Personality.AGGRESSIVE,
         order_bias: OrderBias | None = None,
         base_delay: float = 0.35,
+        batch_size: int = 8,
     ) -> None:
         self.personality = personality
         self.order_bias = order_bias or OrderBias()
         self.base_delay = base_delay
+        self.batch_size = batch_size
         self._rng = random.Random()
         self._rng.seed()
+        self._rand = self._rng.random
+        self._uniform = self._rng.uniform
+        self._alias_cache: Dict[int, Optional[_AliasTable]] = {}
+        self._pending: Deque[Tuple[Action, float]] = deque()
+        self._pending_mask = -1
+        self._rebuild_static()
+
+    def seed(self, value: int | None = None) -> None:
+        """Reseed the RNG and drop choices pre-sampled under the old seed.
+
+        Use this rather than reseeding ``_rng`` directly, which leaves the queue intact.
+        """
+        self._rng.seed(value)
+        self._pending.clear()
+        self._pending_mask = -1
 
     def set_personality(self, personality: Personality) -> None:
         self.personality = personality
+        self._rebuild_static()
 
     def set_order_bias(self, bias: OrderBias) -> None:
         self.order_bias = bias
+        self._rebuild_static()
+
+    def _rebuild_static(self) -> None:
+        """Precompute the weights that only change with personality or orders."""
+        self._static_personality = self.personality
+        self._static_bias = self.order_bias.arr
+        multipliers = PERSONALITY_MULTIPLIERS.get(self.personality, {})
+        offsets = PERSONALITY_OFFSETS.get(self.personality, {})
+        self._alias_cache.clear()
+        self._pending.clear()
+        self._pending_mask = -1
+        self._multipliers = [multipliers.get(action, 1.0) for action in ACTIONS]
+        self._static_weights = [
+            (base + bias) * multiplier + offsets.get(action, 0.0)
+            for base, bias, multiplier, action in zip(
+                BASE_WEIGHT_VECTOR, self._static_bias, self._multipliers, ACTIONS
+            )
+        ]
+
+    def _sync_static(self) -> None:
+        # OrderBias replaces its arr tuple on every change, so identity checks catch in-place edits.
+        if self.order_bias.arr is not self._static_bias or self.personality is not self._static_personality:
+            self._rebuild_static()
 
     def think(self, ctx: AIContext) -> AIChoice:
-        weights = {action: weight for action, weight in BASE_WEIGHTS.items()}
-
-        # 状況バイアス
-        if ctx.threat_level > 0.7:
-            weights[Action.EVADE] += 40
-            weights[Action.STEP] += 15
-        if ctx.energy < 20:
-            weights[Action.STRONG_ATTACK] -= 30
-        if ctx.heat > 70:
-            weights[Action.NORMAL_SHOT] -= 20
-            weights[Action.STRONG_ATTACK] -= 20
-            weights[Action.EVADE] += 20
-        if ctx.hp_ratio < 0.3:
-            weights[Action.KEEP_DISTANCE] += 20
-        if ctx.special >= 100:
-            weights[Action.SPECIAL] += 15
-
-        # 指示バイアス
-        for action in Action:
-            weights[action] += self.order_bias[action]
-
-        # 性格補正
-        if self.personality == Personality.AGGRESSIVE:
-            weights[Action.NORMAL_SHOT] *= 1.3
-            weights[Action.STRONG_ATTACK] *= 1.3
-            weights[Action.EVADE] *= 0.7
-            weights[Action.KEEP_DISTANCE] *= 0.8
-        elif self.personality == Personality.PRUDENT:
-            weights[Action.EVADE] *= 1.3
-            weights[Action.KEEP_DISTANCE] *= 1.1
-            weights[Action.NORMAL_SHOT] *= 0.8
-            weights[Action.STRONG_ATTACK] *= 0.7
-        elif self.personality == Personality.SKITTISH:
-            weights[Action.KEEP_DISTANCE] += 20
-            weights[Action.SPECIAL] -= 15
-            weights[Action.APPROACH] *= 0.7
-            weights[Action.NORMAL_SHOT] *= 0.8
-
-        if not ctx.cooldown_ready:
-            weights[Action.STEP] = 0
+        """Pick the next action, reusing pre-sampled choices while the context mask is unchanged."""
+        self._sync_static()
+        mask = context_mask(ctx)
+        if mask != self._pending_mask or not self._pending:
+            self._pending_mask = mask
+            self._pending = deque(self._sample(mask, self.batch_size))
+        action, jitter = self._pending.popleft()
+        return AIChoice(action=action, delay=self._delay(ctx, jitter))
+
+    def _weights(self, mask: int) -> Tuple[float, ...]:
+        weights = list(self._static_weights)
+        m = self._multipliers
+
+        # 状況バイアス (scaled by the personality multipliers baked into the static weights)
+        if mask & CTX_THREAT:
+            weights[IDX_EVADE] += 40 * m[IDX_EVADE]
+            weights[IDX_STEP] += 15 * m[IDX_STEP]
+        if mask & CTX_LOW_ENERGY:
+            weights[IDX_STRONG_ATTACK] -= 30 * m[IDX_STRONG_ATTACK]
+        if mask & CTX_OVERHEAT:
+            weights[IDX_NORMAL_SHOT] -= 20 * m[IDX_NORMAL_SHOT]
+            weights[IDX_STRONG_ATTACK] -= 20 * m[IDX_STRONG_ATTACK]
+            weights[IDX_EVADE] += 20 * m[IDX_EVADE]
+        if mask & CTX_LOW_HP:
+            weights[IDX_KEEP_DISTANCE] += 20 * m[IDX_KEEP_DISTANCE]
+        if mask & CTX_SPECIAL_READY:
+            weights[IDX_SPECIAL] += 15 * m[IDX_SPECIAL]
+
+        if mask & CTX_STEP_COOLDOWN:
+            weights[IDX_STEP] = 0
 
         # Clamp negatives to zero to avoid misbehavior
-        for action in weights:
-            weights[action] = max(0.0, weights[action])
-
-        # Weighted choice
-        choice = self._weighted_choice(weights)
+        return tuple(max(0.0, weight) for weight in weights)
+
+    def _sample(self, mask: int, k: int) -> List[Tuple[Action, float]]:
+        """Draw ``k`` (action, delay jitter) pairs from the alias table for ``mask``."""
+        try:
+            table = self._alias_cache[mask]
+        except KeyError:
+            weights = self._weights(mask)
+            table = _AliasTable(weights) if sum(weights) > 0 else None
+            self._alias_cache[mask] = table
+        uniform = self._uniform
+        if table is None:
+            return [(A_KEEP_DISTANCE, uniform(-0.08, 0.08)) for _ in range(k)]
+        rand = self._rand
+        sample = table.sample
+        return [(ACTIONS[sample(rand())], uniform(-0.08, 0.08)) for _ in range(k)]
+
+    def _delay(self, ctx: AIContext, jitter: float) -> float:
         delay = self.base_delay * (1 - clamp(ctx.sync, 0.0, 0.9))
-        delay += self._rng.uniform(-0.08, 0.08)
-        delay = max(0.05, delay)
-        return AIChoice(action=choice, delay=delay)
-
-    def _weighted_choice(self, weights: Dict[Action, float]) -> Action:
-        total = sum(weights.values())
-        if total <= 0:
-            return Action.KEEP_DISTANCE
-        target = self._rng.uniform(0, total)
-        cumulative = 0.0
-        for action, weight in weights.items():
-            cumulative += weight
-            if target <= cumulative:
-                return action
-        return Action.KEEP_DISTANCE
+        delay += jitter
+        return max(0.05, delay)
+
+
+BIAS_PRESETS: Mapping[str, Mapping[Action, float]] = MappingProxyType({
+    "aggressive": MappingProxyType({Action.NORMAL_SHOT: 25, Action.STRONG_ATTACK: 35, Action.APPROACH: 15}),
+    "defensive": MappingProxyType({Action.EVADE: 30, Action.KEEP_DISTANCE: 25, Action.STEP: 20}),
+    "focus": MappingProxyType({Action.NORMAL_SHOT: 10, Action.STRONG_ATTACK: 10}),
+    "special": MappingProxyType({Action.SPECIAL: 45}),
+    "balanced": MappingProxyType({}),
+})
 
 
 def bias_from_instruction(name: str) -> OrderBias:
     """Return pre-defined bias sets for quick toggles."""
-    name = name.lower()
-    bias = OrderBias()
-    if name == "aggressive":
-        bias.set_bias(Action.NORMAL_SHOT, 25)
-        bias.set_bias(Action.STRONG_ATTACK, 35)
-        bias.set_bias(Action.APPROACH, 15)
-    elif name == "defensive":
-        bias.set_bias(Action.EVADE, 30)
-        bias.set_bias(Action.KEEP_DISTANCE, 25)
-        bias.set_bias(Action.STEP, 20)
-    elif name == "focus":
-        bias.set_bias(Action.NORMAL_SHOT, 10)
-        bias.set_bias(Action.STRONG_ATTACK, 10)
-    elif name == "special":
-        bias.set_bias(Action.SPECIAL, 45)
-    elif name == "balanced":
-        pass
-    else:
-        raise ValueError(f"Unknown instruction '{name}'")
-    return bias
+    try:
+        return OrderBias(BIAS_PRESETS[name.lower()])
+    except KeyError:
+        raise ValueError(f"Unknown instruction '{name.lower()}'") from None
@@ -10,23 +10,32 @@ import pygame
 
 Vec = pygame.math.Vector2
 
+# Fan of seven special-attack shots from -45 to 45 degrees, as (vx, vy).
+_SPECIAL_VELOCITIES: Tuple[Tuple[float, float], ...] = tuple(
+    (math.sin(math.radians(angle)) * 420, -math.cos(math.radians(angle)) * 420)
+    for angle in range(-45, 50, 15)
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class Bullet:
-    position: Vec
-    velocity: Vec
+    x: float
+    y: float
+    vx: float
+    vy: float
     damage: float
     radius: int
     friendly: bool
 
     def update(self, dt: float) -> None:
-        self.position += self.velocity * dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
 
     def to_rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.position.x - self.radius), int(self.position.y - self.radius), self.radius * 2, self.radius * 2)
+        return pygame.Rect(int(self.x - self.radius), int(self.y - self.radius), self.radius * 2, self.radius * 2)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     hp: float = 100
     max_hp: float = 100
@@ -51,9 +60,9 @@ class Player:
         self.invincible = 0.0
 
     def update(self, dt: float) -> None:
-        self.position += self.velocity * dt
-        self.position.x = max(30, min(610, self.position.x))
-        self.position.y = max(40, min(440, self.position.y))
+        pos = self.position
+        pos.x = max(30, min(610, pos.x + self.velocity.x * dt))
+        pos.y = max(40, min(440, pos.y + self.velocity.y * dt))
         self.stats.energy = min(self.stats.max_energy, self.stats.energy + 20 * dt)
         self.stats.heat = max(0, self.stats.heat - 15 * dt)
         self.stats.special = min(self.stats.max_special, self.stats.special + 5 * dt)
@@ -89,7 +98,7 @@ class Player:
         self.shot_timer = 0.18
         self.stats.heat = min(self.stats.max_heat, self.stats.heat + 8)
         self.stats.energy = min(self.stats.max_energy, self.stats.energy + 5)
-        bullet = Bullet(self.position.copy(), Vec(0, -420), 6, 4, True)
+        bullet = Bullet(self.position.x, self.position.y, 0, -420, 6, 4, True)
         return [bullet]
 
     def strong_attack(self) -> List[Bullet]:
@@ -98,10 +107,10 @@ class Player:
         self.strong_timer = 0.9
         self.stats.energy -= 35
         self.stats.heat = min(self.stats.max_heat, self.stats.heat + 25)
+        x, y = self.position
         bullets = []
         for offset in (-25, 0, 25):
-            bullet_pos = self.position + Vec(offset, -5)
-            bullets.append(Bullet(bullet_pos, Vec(0, -520), 22, 6, True))
+            bullets.append(Bullet(x + offset, y - 5, 0, -520, 22, 6, True))
         return bullets
 
     def step(self, direction: Vec) -> None:
@@ -118,12 +127,8 @@ class Player:
         self.stats.special = 0
         self.stats.energy = max(0, self.stats.energy - 40)
         self.stats.heat = min(self.stats.max_heat, self.stats.heat + 40)
-        bullets = []
-        for angle in range(-45, 50, 15):
-            rad = math.radians(angle)
-            velocity = Vec(math.sin(rad) * 420, -math.cos(rad) * 420)
-            bullets.append(Bullet(self.position.copy(), velocity, 18, 6, True))
-        return bullets
+        x, y = self.position
+        return [Bullet(x, y, vx, vy, 18, 6, True) for vx, vy in _SPECIAL_VELOCITIES]
 
 
 class Enemy:
@@ -136,17 +141,20 @@ class Enemy:
         self.type = "boss"
 
     def update(self, dt: float, target: Vec) -> List[Bullet]:
-        direction = (target - self.position)
-        if direction.length() > 1:
-            self.position += direction.normalize() * self.speed * dt * 0.4
+        pos = self.position
+        dx = target.x - pos.x
+        dy = target.y - pos.y
+        dist = math.hypot(dx, dy)
+        if dist > 1:
+            step = self.speed * dt * 0.4 / dist
+            pos.x += dx * step
+            pos.y += dy * step
         bullets: List[Bullet] = []
         self.shoot_timer -= dt
         if self.shoot_timer <= 0:
             self.shoot_timer = 0.75
             for offset in (-40, -10, 10, 40):
-                start = self.position + Vec(offset, 20)
-                velocity = Vec(offset * 0.9, 210)
-                bullets.append(Bullet(start, velocity, 12, 6, False))
+                bullets.append(Bullet(pos.x + offset, pos.y + 20, offset * 0.9, 210, 12, 6, False))
         return bullets
 
     def rect(self) -> pygame.Rect:
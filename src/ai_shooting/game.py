@@ -1,33 +1,68 @@
 """Main game loop for semi-auto shooter '指示と本能'."""
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 import pygame
 
-from .ai import Action, AIContext, AIController, Personality, bias_from_instruction
+from .ai import (
+    A_APPROACH,
+    A_EVADE,
+    A_KEEP_DISTANCE,
+    A_NORMAL_SHOT,
+    A_SPECIAL,
+    A_STEP,
+    A_STRONG_ATTACK,
+    Action,
+    AIContext,
+    AIController,
+    Personality,
+    bias_from_instruction,
+)
 from .entities import Bullet, Enemy, Player
 
 WIDTH = 640
 HEIGHT = 480
 FPS = 60
 
+PLAYER_BULLET_COLOR = (220, 220, 255)
+ENEMY_BULLET_COLOR = (255, 200, 90)
 
-@dataclass
+
+@dataclass(slots=True)
 class InputState:
     instruction: str = "balanced"
     personality: Personality = Personality.AGGRESSIVE
 
 
+class BulletSprites(dict):
+    """Pre-rendered bullet circles of one color, rendered lazily per radius."""
+
+    def __init__(self, color: Tuple[int, int, int]) -> None:
+        super().__init__()
+        self.color = color
+
+    def __missing__(self, radius: int) -> pygame.Surface:
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(sprite, self.color, (radius, radius), radius)
+        self[radius] = sprite
+        return sprite
+
+
 class Game:
     def __init__(self) -> None:
         pygame.init()
         pygame.display.set_caption("指示と本能 / Orders & Instinct")
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # pygame-ce has Surface.fblits; upstream pygame skips the Rect list via doreturn=False.
+        self._has_fblits = hasattr(self.screen, "fblits")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("noto sans", 18)
         self.big_font = pygame.font.SysFont("noto sans", 28)
+        self.player_bullet_sprites = BulletSprites(PLAYER_BULLET_COLOR)
+        self.enemy_bullet_sprites = BulletSprites(ENEMY_BULLET_COLOR)
         self.player = Player((WIDTH / 2, HEIGHT - 80))
         self.enemy = Enemy((WIDTH / 2, 120), hp=1200)
         self.player_bullets: List[Bullet] = []
@@ -37,6 +72,8 @@ class Game:
         self.ai = AIController()
         self.ai.set_order_bias(self.order_bias)
         self.ai_timer = 0.0
+        self.threat_level = 0.0
+        self.threat_vector = pygame.math.Vector2(0, 0)
         self.running = True
 
     def run(self) -> None:
@@ -94,7 +131,9 @@ class Game:
         self.player.velocity *= 0.85
 
     def build_context(self) -> AIContext:
-        threat = self.calculate_threat_level()
+        # Only runs on AI ticks; the HUD reads the cached threat_level in between.
+        threat, self.threat_vector = self.scan_threats()
+        self.threat_level = threat
         distance = (self.enemy.position - self.player.position).length()
         target_score = 1.0  # single boss
         energy = self.player.stats.energy
@@ -117,15 +156,15 @@ class Game:
 
     def execute_action(self, action: Action) -> None:
         to_add: List[Bullet] = []
-        if action == Action.NORMAL_SHOT:
+        if action == A_NORMAL_SHOT:
             to_add = self.player.shoot()
-        elif action == Action.STRONG_ATTACK and self.player.stats.energy >= 35:
+        elif action == A_STRONG_ATTACK and self.player.stats.energy >= 35:
             to_add = self.player.strong_attack()
-        elif action == Action.APPROACH:
+        elif action == A_APPROACH:
             direction = (self.enemy.position - self.player.position)
             if direction.length() > 1:
                 self.player.velocity = direction.normalize() * self.player.speed
-        elif action == Action.KEEP_DISTANCE:
+        elif action == A_KEEP_DISTANCE:
             desired = 200
             direction = (self.player.position - self.enemy.position)
             if direction.length() == 0:
@@ -136,73 +175,101 @@ class Game:
                 self.player.velocity = move * self.player.speed
             else:
                 self.player.velocity = move.rotate(90) * self.player.speed * 0.3
-        elif action == Action.EVADE:
-            threat_vec = self.aggregate_threat_vector()
+        elif action == A_EVADE:
+            threat_vec = self.threat_vector
             if threat_vec.length() > 0:
                 self.player.velocity = threat_vec.normalize() * self.player.speed
             else:
                 self.player.velocity = pygame.math.Vector2(0, self.player.speed)
-        elif action == Action.STEP:
-            threat_vec = self.aggregate_threat_vector()
+        elif action == A_STEP:
+            threat_vec = self.threat_vector
             direction = threat_vec.normalize() if threat_vec.length() > 0 else pygame.math.Vector2(0, -1)
             self.player.step(direction)
-        elif action == Action.SPECIAL:
+        elif action == A_SPECIAL:
             to_add = self.player.use_special()
         if to_add:
             self.player_bullets.extend(to_add)
 
-    def calculate_threat_level(self) -> float:
-        radius = 64
+    def scan_threats(self) -> Tuple[float, pygame.math.Vector2]:
+        """Return the threat level and the evade vector from one pass over enemy bullets."""
+        near_sq = 64 * 64
+        far_sq = 160 * 160
+        px, py = self.player.position
         count = 0
+        vx = vy = 0.0
         for bullet in self.enemy_bullets:
-            if (bullet.position - self.player.position).length_squared() <= radius ** 2:
-                count += 1
-        return min(1.0, count / 10)
-
-    def aggregate_threat_vector(self) -> pygame.math.Vector2:
-        vec = pygame.math.Vector2(0, 0)
-        radius = 160
-        for bullet in self.enemy_bullets:
-            offset = bullet.position - self.player.position
-            dist = offset.length()
-            if dist < radius and dist > 0:
-                vec -= offset / dist
-        return vec
+            dx = bullet.x - px
+            dy = bullet.y - py
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < far_sq:
+                if dist_sq <= near_sq:
+                    count += 1
+                if dist_sq > 0:
+                    dist = math.sqrt(dist_sq)
+                    vx -= dx / dist
+                    vy -= dy / dist
+        return min(1.0, count / 10), pygame.math.Vector2(vx, vy)
 
     def update_bullets(self, dt: float) -> None:
+        player_bullets: List[Bullet] = []
         for bullet in self.player_bullets:
             bullet.update(dt)
+            if -20 <= bullet.x <= WIDTH + 20 and bullet.y > -40:
+                player_bullets.append(bullet)
+        enemy_bullets: List[Bullet] = []
         for bullet in self.enemy_bullets:
             bullet.update(dt)
-        self.player_bullets = [b for b in self.player_bullets if -20 <= b.position.x <= WIDTH + 20 and b.position.y > -40]
-        self.enemy_bullets = [b for b in self.enemy_bullets if -40 <= b.position.x <= WIDTH + 40 and b.position.y < HEIGHT + 60]
-
+            if -40 <= bullet.x <= WIDTH + 40 and bullet.y < HEIGHT + 60:
+                enemy_bullets.append(bullet)
+        self.player_bullets = player_bullets
+        self.enemy_bullets = enemy_bullets
 
     def handle_collisions(self) -> None:
-        enemy_rect = self.enemy.rect()
-        for bullet in list(self.player_bullets):
-            if enemy_rect.collidepoint(bullet.position):
-                self.enemy.take_damage(bullet.damage)
-                self.player_bullets.remove(bullet)
-        player_rect = self.player.rect()
-        for bullet in list(self.enemy_bullets):
-            if player_rect.collidepoint(bullet.position):
-                self.player.take_damage(bullet.damage)
-                self.enemy_bullets.remove(bullet)
+        left, top, width, height = self.enemy.rect()
+        right, bottom = left + width, top + height
+        survivors: List[Bullet] = []
+        damage = 0.0
+        for bullet in self.player_bullets:
+            if left <= bullet.x < right and top <= bullet.y < bottom:
+                damage += bullet.damage
+            else:
+                survivors.append(bullet)
+        if damage:
+            self.enemy.take_damage(damage)
+        self.player_bullets = survivors
+
+        left, top, width, height = self.player.rect()
+        right, bottom = left + width, top + height
+        survivors = []
+        damage = 0.0
+        for bullet in self.enemy_bullets:
+            if left <= bullet.x < right and top <= bullet.y < bottom:
+                damage += bullet.damage
+            else:
+                survivors.append(bullet)
+        if damage:
+            self.player.take_damage(damage)
+        self.enemy_bullets = survivors
 
     def draw(self) -> None:
         self.screen.fill((10, 12, 20))
         pygame.draw.rect(self.screen, (50, 180, 255), self.player.rect(), border_radius=12)
         pygame.draw.rect(self.screen, (255, 80, 80), self.enemy.rect(), border_radius=18)
 
-        for bullet in self.player_bullets:
-            pygame.draw.circle(self.screen, (220, 220, 255), bullet.position, bullet.radius)
-        for bullet in self.enemy_bullets:
-            pygame.draw.circle(self.screen, (255, 200, 90), bullet.position, bullet.radius)
+        sprites = self.player_bullet_sprites
+        self.blit_batch([(sprites[b.radius], (b.x - b.radius, b.y - b.radius)) for b in self.player_bullets])
+        sprites = self.enemy_bullet_sprites
+        self.blit_batch([(sprites[b.radius], (b.x - b.radius, b.y - b.radius)) for b in self.enemy_bullets])
 
         self.draw_ui()
         pygame.display.flip()
 
+    def blit_batch(self, sequence: List[Tuple[pygame.Surface, Tuple[float, float]]]) -> None:
+        if self._has_fblits:
+            self.screen.fblits(sequence)
+        else:
+            self.screen.blits(sequence, doreturn=False)
+
     def draw_ui(self) -> None:
         stats = self.player.stats
         bars = [
@@ -224,7 +291,7 @@ class Game:
             "[Q]バランス [W]突撃 [E]回避 [R]集中射撃 [T]必殺優先",
             "[1]猪突 [2]慎重 [3]臆病 / ESCで終了",
             f"指示: {self.input_state.instruction}  性格: {self.ai.personality.value}",
-            f"ボスHP: {self.enemy.hp:5.0f}",
+            f"ボスHP: {self.enemy.hp:5.0f}  脅威: {self.threat_level:.1f}",
         ]
         for i, line in enumerate(info_lines):
             text = self.font.render(line, True, (240, 240, 240))